@@ -243,10 +243,17 @@ class AsyncRx(AsyncObservable[_TSource]):
 
         return AsyncRx(pipe(self, delay(seconds)))
 
-    def distinct_until_changed(self) -> AsyncObservable[_TSource]:
+    def distinct_until_changed(
+        self,
+        *,
+        comparer: Optional[Callable[[Any, Any], bool]] = None,
+        key: Optional[Callable[[_TSource], Any]] = None,
+    ) -> AsyncObservable[_TSource]:
         from .filtering import distinct_until_changed
 
-        return AsyncRx(distinct_until_changed(self))
+        if comparer is not None:
+            return AsyncRx(distinct_until_changed(self, comparer=comparer, key=key))
+        return AsyncRx(distinct_until_changed(self, key=key))
 
     def filter(self, predicate: Callable[[_TSource], bool]) -> AsyncRx[_TSource]:
         """Filter stream.
@@ -603,10 +610,15 @@ def delay(
 
 def distinct_until_changed(
     source: AsyncObservable[_TSource],
+    *,
+    comparer: Optional[Callable[[Any, Any], bool]] = None,
+    key: Optional[Callable[[_TSource], Any]] = None,
 ) -> AsyncObservable[_TSource]:
     from .filtering import distinct_until_changed
 
-    return distinct_until_changed(source)
+    if comparer is not None:
+        return distinct_until_changed(source, comparer=comparer, key=key)
+    return distinct_until_changed(source, key=key)
 
 
 def empty() -> "AsyncObservable[Any]":
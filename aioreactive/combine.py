@@ -89,50 +89,48 @@ def merge_inner(
                     msg: Msg[_TSource], model: Model[_TSource]
                 ) -> Model[_TSource]:
                     # log.debug("update: %s, model: %s", msg, model)
-                    with match(msg) as case:
-                        for xs in case(InnerObservableMsg[_TSource]):
-                            if (
-                                max_concurrent == 0
-                                or len(model.subscriptions) < max_concurrent
-                            ):
-                                inner = await xs.subscribe_async(obv(model.key))
-                                return model.replace(
-                                    subscriptions=model.subscriptions.add(
-                                        model.key, inner
-                                    ),
-                                    key=Key(model.key + 1),
-                                )
-                            lst = Block.singleton(xs)
-                            return model.replace(queue=model.queue.append(lst))
-                        for key in case(InnerCompletedMsg[Key]):
-                            subscriptions = model.subscriptions.remove(key)
-                            if len(model.queue):
-                                xs = model.queue[0]
-                                inner = await xs.subscribe_async(obv(model.key))
-
-                                return model.replace(
-                                    subscriptions=subscriptions.add(model.key, inner),
-                                    key=model.key + 1,
-                                    queue=model.queue.tail(),
-                                )
-                            elif len(subscriptions):
-                                return model.replace(subscriptions=subscriptions)
-                            else:
-                                if model.is_stopped:
-                                    await safe_obv.aclose()
-                                return model.replace(subscriptions=map.empty)
-                        while case(CompletedMsg):
-                            if not model.subscriptions:
-                                log.debug("merge_inner: closing!")
+                    if isinstance(msg, InnerObservableMsg):
+                        xs: AsyncObservable[_TSource] = msg.inner_observable
+                        if (
+                            max_concurrent == 0
+                            or len(model.subscriptions) < max_concurrent
+                        ):
+                            inner = await xs.subscribe_async(obv(model.key))
+                            return model.replace(
+                                subscriptions=model.subscriptions.add(model.key, inner),
+                                key=Key(model.key + 1),
+                            )
+                        lst = Block.singleton(xs)
+                        return model.replace(queue=model.queue.append(lst))
+                    elif isinstance(msg, InnerCompletedMsg):
+                        key = Key(msg.key)
+                        subscriptions = model.subscriptions.remove(key)
+                        if len(model.queue):
+                            xs = model.queue[0]
+                            inner = await xs.subscribe_async(obv(model.key))
+
+                            return model.replace(
+                                subscriptions=subscriptions.add(model.key, inner),
+                                key=model.key + 1,
+                                queue=model.queue.tail(),
+                            )
+                        elif len(subscriptions):
+                            return model.replace(subscriptions=subscriptions)
+                        else:
+                            if model.is_stopped:
                                 await safe_obv.aclose()
+                            return model.replace(subscriptions=map.empty)
+                    elif msg is CompletedMsg:
+                        if not model.subscriptions:
+                            log.debug("merge_inner: closing!")
+                            await safe_obv.aclose()
 
-                            return model.replace(is_stopped=True)
-
-                        while case.default():
-                            for dispose in model.subscriptions.values():
-                                await dispose.dispose_async()
+                        return model.replace(is_stopped=True)
+                    else:
+                        for dispose in model.subscriptions.values():
+                            await dispose.dispose_async()
 
-                        return initial_model.replace(is_stopped=True)
+                    return initial_model.replace(is_stopped=True)
 
                 async def message_loop(model: Model[_TSource]) -> None:
                     while True:
@@ -214,25 +212,21 @@ def combine_latest(
                 cn = await inbox.receive()
 
                 async def get_value(n: Notification[Any]) -> Option[Any]:
-                    with match(n) as m:
-                        for value in case(OnNext[_TSource]):
-                            return Some(value)
+                    if isinstance(n, OnNext):
+                        return Some(n.value)
 
-                        for err in case(OnError):
-                            await safe_obv.athrow(err)
-
-                        while m.default():
-                            await safe_obv.aclose()
+                    if isinstance(n, OnError):
+                        await safe_obv.athrow(n.exception)
+                    else:
+                        await safe_obv.aclose()
                     return Nothing
 
-                with match(cn) as case:
-                    for value in case(SourceMsg[_TSource]):
-                        source_value = await get_value(value)
-                        break
-
-                    for value in case(OtherMsg[_TOther]):
-                        other_value = await get_value(value)
-                        break
+                if isinstance(cn, SourceMsg):
+                    cn = cast(SourceMsg[_TSource], cn)
+                    source_value = await get_value(cn.value)
+                else:
+                    cn = cast(OtherMsg[_TOther], cn)
+                    other_value = await get_value(cn.value)
 
                 def binder(s: _TSource) -> Option[Tuple[_TSource, _TOther]]:
                     def mapper(o: _TOther) -> Tuple[_TSource, _TOther]:
@@ -300,15 +294,13 @@ def with_latest_from(
                 cn = await inbox.receive()
 
                 async def get_value(n: Notification[Any]) -> Option[Any]:
-                    with match(n) as case:
-                        for value in case(OnNext[_TSource]):
-                            return Some(value)
-
-                        for err in case(OnError[_TSource]):
-                            await safe_obv.athrow(err)
+                    if isinstance(n, OnNext):
+                        return Some(n.value)
 
-                        if case.default():
-                            await safe_obv.aclose()
+                    if isinstance(n, OnError):
+                        await safe_obv.athrow(n.exception)
+                    else:
+                        await safe_obv.aclose()
                     return Nothing
 
                 source_value = Nothing
@@ -360,25 +352,22 @@ def zip_seq(
         safe_obv, auto_detach = auto_detach_observer(aobv)
 
         enumerator = iter(sequence)
+        send = safe_obv.asend
+        throw = safe_obv.athrow
+        close = safe_obv.aclose
 
         async def asend(x: _TSource) -> None:
             try:
                 try:
                     n = next(enumerator)
-                    await safe_obv.asend((x, n))
+                    await send((x, n))
                 except StopIteration:
-                    await safe_obv.aclose()
+                    await close()
             except Exception as ex:
-                await safe_obv.athrow(ex)
-
-        async def athrow(ex: Exception) -> None:
-            await safe_obv.athrow(ex)
-
-        async def aclose() -> None:
-            await safe_obv.aclose()
+                await throw(ex)
 
         return await pipe(
-            AsyncAnonymousObserver(asend, athrow, aclose),
+            AsyncAnonymousObserver(asend, throw, close),
             source.subscribe_async,
             auto_detach,
         )
@@ -1,32 +1,209 @@
-from typing import Any, Awaitable, Callable, Iterable, List, NoReturn, Optional, TypeVar
-
-from expression.collections import seq
-from expression.core import (
-    MailboxProcessor,
-    Option,
-    TailCall,
-    TailCallResult,
-    aiotools,
-    compose,
-    pipe,
-    tailrec_async,
+import operator
+from collections import deque
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Iterable,
+    Optional,
+    TypeVar,
 )
+
+from expression.core import Option, aiotools, pipe
 from expression.system.disposable import AsyncDisposable
 
-from .combine import zip_seq
-from .notification import Notification, OnCompleted, OnError, OnNext
+from .create import empty
 from .observables import AsyncAnonymousObservable
-from .observers import (
-    AsyncAnonymousObserver,
-    AsyncNotificationObserver,
-    auto_detach_observer,
-)
-from .transform import map, transform
+from .observers import AsyncAnonymousObserver, auto_detach_observer
+from .transform import transform
 from .types import AsyncObservable, AsyncObserver
 
 _TSource = TypeVar("_TSource")
 _TResult = TypeVar("_TResult")
 
+_MISSING: Any = object()
+"""Sentinel for "no value seen yet"; compared with `is` only."""
+
+
+class _ForwardObserver(AsyncObserver[_TSource]):
+    """Observer base that forwards errors and completion downstream.
+
+    Subclasses implement `asend` and keep their per-subscription state
+    in slots, avoiding the closure cells and extra callable dispatch of
+    an `AsyncAnonymousObserver`.
+    """
+
+    __slots__ = ("_obv",)
+
+    def __init__(self, obv: AsyncObserver[_TSource]) -> None:
+        self._obv = obv
+
+    async def athrow(self, error: Exception) -> None:
+        await self._obv.athrow(error)
+
+    async def aclose(self) -> None:
+        await self._obv.aclose()
+
+
+class _FilterObserver(_ForwardObserver[_TSource]):
+    __slots__ = ("_predicate",)
+
+    def __init__(
+        self, obv: AsyncObserver[_TSource], predicate: Callable[[_TSource], bool]
+    ) -> None:
+        super().__init__(obv)
+        self._predicate = predicate
+
+    async def asend(self, value: _TSource) -> None:
+        if self._predicate(value):
+            await self._obv.asend(value)
+
+    async def asend_many(self, values: Iterable[_TSource]) -> None:
+        predicate = self._predicate
+        send = self._obv.asend
+        for value in values:
+            if predicate(value):
+                await send(value)
+
+
+class _FilterIndexedObserver(_ForwardObserver[_TSource]):
+    __slots__ = ("_predicate", "_index")
+
+    def __init__(
+        self,
+        obv: AsyncObserver[_TSource],
+        predicate: Callable[[_TSource, int], bool],
+    ) -> None:
+        super().__init__(obv)
+        self._predicate = predicate
+        self._index = 0
+
+    async def asend(self, value: _TSource) -> None:
+        i = self._index
+        self._index = i + 1
+        if self._predicate(value, i):
+            await self._obv.asend(value)
+
+
+class _SkipObserver(_ForwardObserver[_TSource]):
+    __slots__ = ("_remaining",)
+
+    def __init__(self, obv: AsyncObserver[_TSource], count: int) -> None:
+        super().__init__(obv)
+        self._remaining = count
+
+    async def asend(self, value: _TSource) -> None:
+        if self._remaining <= 0:
+            await self._obv.asend(value)
+        else:
+            self._remaining -= 1
+
+    async def asend_many(self, values: Iterable[_TSource]) -> None:
+        send = self._obv.asend
+        for value in values:
+            if self._remaining <= 0:
+                await send(value)
+            else:
+                self._remaining -= 1
+
+
+class _TakeObserver(_ForwardObserver[_TSource]):
+    __slots__ = ("_remaining",)
+
+    def __init__(self, obv: AsyncObserver[_TSource], count: int) -> None:
+        super().__init__(obv)
+        self._remaining = count
+
+    async def asend(self, value: _TSource) -> None:
+        if self._remaining > 0:
+            self._remaining -= 1
+            await self._obv.asend(value)
+            if not self._remaining:
+                await self._obv.aclose()
+
+    async def asend_many(self, values: Iterable[_TSource]) -> None:
+        send = self._obv.asend
+        for value in values:
+            if self._remaining <= 0:
+                return
+            self._remaining -= 1
+            await send(value)
+            if not self._remaining:
+                await self._obv.aclose()
+                return
+
+
+class _SkipLastObserver(_ForwardObserver[_TSource]):
+    __slots__ = ("_count", "_q")
+
+    def __init__(self, obv: AsyncObserver[_TSource], count: int) -> None:
+        super().__init__(obv)
+        self._count = count
+        self._q: Deque[_TSource] = deque(maxlen=count + 1)
+
+    async def asend(self, value: _TSource) -> None:
+        q = self._q
+        q.append(value)
+        front = q.popleft() if len(q) > self._count else None
+
+        if front is not None:
+            await self._obv.asend(front)
+
+
+class _SliceObserver(_ForwardObserver[_TSource]):
+    __slots__ = ("_start", "_stop", "_step", "_index")
+
+    def __init__(
+        self,
+        obv: AsyncObserver[_TSource],
+        start: int,
+        stop: Optional[int],
+        step: int,
+    ) -> None:
+        super().__init__(obv)
+        self._start = start
+        self._stop = stop
+        self._step = step
+        self._index = 0
+
+    async def asend(self, value: _TSource) -> None:
+        i = self._index
+        stop = self._stop
+        if stop is not None and i >= stop:
+            return
+        self._index = i + 1
+
+        if i < self._start:
+            return
+        if (i - self._start) % self._step == 0:
+            await self._obv.asend(value)
+        if stop is not None and self._index >= stop:
+            await self._obv.aclose()
+
+
+class _TakeLastObserver(_ForwardObserver[_TSource]):
+    """Keeps the trailing window in a bounded deque.
+
+    The deque acts as a preallocated ring buffer: with `maxlen` set,
+    appends are O(1), never resize, and evict the oldest element in C.
+    """
+
+    __slots__ = ("_q",)
+
+    def __init__(self, obv: AsyncObserver[_TSource], count: int) -> None:
+        super().__init__(obv)
+        self._q: Deque[_TSource] = deque(maxlen=count)
+
+    async def asend(self, value: _TSource) -> None:
+        self._q.append(value)
+
+    async def aclose(self) -> None:
+        send = self._obv.asend
+        for item in self._q:
+            await send(item)
+        await self._obv.aclose()
+
 
 def choose_async(
     chooser: Callable[[_TSource], Awaitable[Option[_TResult]]]
@@ -35,8 +212,8 @@ def choose_async(
         next: Callable[[_TResult], Awaitable[None]], xs: _TSource
     ) -> None:
         result = await chooser(xs)
-        for x in result.to_list():
-            await next(x)
+        if result.is_some():
+            await next(result.value)
 
     return transform(handler)
 
@@ -47,8 +224,9 @@ def choose(
     def handler(
         next: Callable[[_TResult], Awaitable[None]], xs: _TSource
     ) -> Awaitable[None]:
-        for x in chooser(xs).to_list():
-            return next(x)
+        result = chooser(xs)
+        if result.is_some():
+            return next(result.value)
         return aiotools.empty()
 
     return transform(handler)
@@ -80,14 +258,14 @@ def filter_async(
 def filter(
     predicate: Callable[[_TSource], bool]
 ) -> Callable[[AsyncObservable[_TSource]], AsyncObservable[_TSource]]:
-    def handler(
-        next: Callable[[_TSource], Awaitable[None]], x: _TSource
-    ) -> Awaitable[None]:
-        if predicate(x):
-            return next(x)
-        return aiotools.empty()
+    def _filter(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
+        async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
+            obv = _FilterObserver(aobv, predicate)
+            return await source.subscribe_async(obv)
 
-    return transform(handler)
+        return AsyncAnonymousObservable(subscribe_async)
+
+    return _filter
 
 
 def starfilter(
@@ -114,16 +292,21 @@ def starfilter(
 def filteri(
     predicate: Callable[[_TSource, int], bool]
 ) -> Callable[[AsyncObservable[_TSource]], AsyncObservable[_TSource]]:
-    ret = compose(
-        zip_seq(seq.infinite),
-        starfilter(predicate),
-        map(seq.head),
-    )
-    return ret
+    def _filteri(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
+        async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
+            obv = _FilterIndexedObserver(aobv, predicate)
+            return await source.subscribe_async(obv)
+
+        return AsyncAnonymousObservable(subscribe_async)
+
+    return _filteri
 
 
 def distinct_until_changed(
     source: AsyncObservable[_TSource],
+    *,
+    comparer: Callable[[Any, Any], bool] = operator.eq,
+    key: Optional[Callable[[_TSource], Any]] = None,
 ) -> AsyncObservable[_TSource]:
     """Distinct until changed.
 
@@ -132,6 +315,11 @@ def distinct_until_changed(
 
     Args:
         source (AsyncObservable[TSource]): [description]
+        comparer: Optional equality used to compare keys. Defaults to
+            `operator.eq`. Identical keys (`is`) are always considered
+            equal without calling the comparer.
+        key: Optional key selector applied to each element before
+            comparing. Defaults to the element itself.
 
     Returns:
         Async observable with only contiguous distinct elements.
@@ -140,45 +328,19 @@ def distinct_until_changed(
     async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
         safe_obv, auto_detach = auto_detach_observer(aobv)
 
-        async def worker(inbox: MailboxProcessor[Notification[_TSource]]) -> None:
-            @tailrec_async
-            async def message_loop(
-                latest: Notification[_TSource],
-            ) -> "TailCallResult[NoReturn, [Notification[_TSource]]]":
-                n = await inbox.receive()
-
-                async def get_latest() -> Notification[_TSource]:
-                    with match(n) as case:
-                        for x in case(OnNext[_TSource]):
-                            if n == latest:
-                                break
-                            try:
-                                await safe_obv.asend(x)
-                            except Exception as ex:
-                                await safe_obv.athrow(ex)
-                            break
-                        for err in case(OnError[_TSource]):
-                            await safe_obv.athrow(err)
-                            break
-                        while case(OnCompleted):
-                            await safe_obv.aclose()
-                            break
-
-                    return n
-
-                latest = await get_latest()
-                return TailCall[Notification[_TSource]](latest)
-
-            await message_loop(
-                OnCompleted
-            )  # Use as sentinel value as it will not match any OnNext value
-
-        agent = MailboxProcessor.start(worker)
-
-        async def notification(n: Notification[_TSource]) -> None:
-            agent.post(n)
-
-        obv: AsyncObserver[_TSource] = AsyncNotificationObserver(notification)
+        last_key: Any = _MISSING
+        send = safe_obv.asend
+
+        async def asend(value: _TSource) -> None:
+            nonlocal last_key
+
+            k = key(value) if key else value
+            if last_key is not _MISSING and (k is last_key or comparer(last_key, k)):
+                return
+            last_key = k
+            await send(value)
+
+        obv = AsyncAnonymousObserver(asend, safe_obv.athrow, safe_obv.aclose)
         return await pipe(obv, source.subscribe_async, auto_detach)
 
     return AsyncAnonymousObservable(subscribe_async)
@@ -198,21 +360,18 @@ def skip(
     Returns:
         Stream[TSource, TSource]: [description]
     """
+    if count == 0:
+        # Skipping nothing is the identity operator.
+        def _identity(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
+            return source
+
+        return _identity
 
     def _skip(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
         async def subscribe_async(obvAsync: AsyncObserver[_TSource]) -> AsyncDisposable:
             safe_obv, auto_detach = auto_detach_observer(obvAsync)
 
-            remaining = count
-
-            async def asend(value: _TSource) -> None:
-                nonlocal remaining
-                if remaining <= 0:
-                    await safe_obv.asend(value)
-                else:
-                    remaining -= 1
-
-            obv = AsyncAnonymousObserver(asend, safe_obv.athrow, safe_obv.aclose)
+            obv = _SkipObserver(safe_obv, count)
             return await pipe(obv, source.subscribe_async, auto_detach)
 
         return AsyncAnonymousObservable(subscribe_async)
@@ -227,18 +386,7 @@ def skip_last(
         async def subscribe_async(observer: AsyncObserver[_TSource]) -> AsyncDisposable:
             safe_obv, auto_detach = auto_detach_observer(observer)
 
-            q: List[_TSource] = []
-
-            async def asend(value: _TSource) -> None:
-                front = None
-                q.append(value)
-                if len(q) > count:
-                    front = q.pop(0)
-
-                if front is not None:
-                    await safe_obv.asend(front)
-
-            obv = AsyncAnonymousObserver(asend, safe_obv.athrow, safe_obv.aclose)
+            obv = _SkipLastObserver(safe_obv, count)
             return await pipe(obv, source.subscribe_async, auto_detach)
 
         return AsyncAnonymousObservable(subscribe_async)
@@ -252,22 +400,18 @@ def take(
     if count < 0:
         raise ValueError("Count cannot be negative.")
 
+    if count == 0:
+        # Taking nothing is the empty observable.
+        def _empty(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
+            return empty()
+
+        return _empty
+
     def _take(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
         async def subscribe_async(obvAsync: AsyncObserver[_TSource]) -> AsyncDisposable:
             safe_obv, auto_detach = auto_detach_observer(obvAsync)
 
-            remaining = count
-
-            async def asend(value: _TSource) -> None:
-                nonlocal remaining
-
-                if remaining > 0:
-                    remaining -= 1
-                    await safe_obv.asend(value)
-                    if not remaining:
-                        await safe_obv.aclose()
-
-            obv = AsyncAnonymousObserver(asend, safe_obv.athrow, safe_obv.aclose)
+            obv = _TakeObserver(safe_obv, count)
             return await pipe(obv, source.subscribe_async, auto_detach)
 
         return AsyncAnonymousObservable(subscribe_async)
@@ -293,19 +437,8 @@ def take_last(
     def _take_last(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
         async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
             safe_obv, auto_detach = auto_detach_observer(aobv)
-            queue: List[_TSource] = []
 
-            async def asend(value: _TSource) -> None:
-                queue.append(value)
-                if len(queue) > count:
-                    queue.pop(0)
-
-            async def aclose() -> None:
-                for item in queue:
-                    await safe_obv.asend(item)
-                await safe_obv.aclose()
-
-            obv = AsyncAnonymousObserver(asend, safe_obv.athrow, aclose)
+            obv = _TakeLastObserver(safe_obv, count)
             return await pipe(obv, source.subscribe_async, auto_detach)
 
         return AsyncAnonymousObservable(subscribe_async)
@@ -332,12 +465,20 @@ def take_until(
         async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
             safe_obv, auto_detach = auto_detach_observer(aobv)
 
+            # Filled in once the subscriptions exist so the trigger can
+            # cut off both the source and the other observation instead
+            # of just closing downstream.
+            subs: list[AsyncDisposable] = []
+
             async def asend(value: _TSource) -> None:
                 await safe_obv.aclose()
+                while subs:
+                    await subs.pop().dispose_async()
 
             obv = AsyncAnonymousObserver(asend, safe_obv.athrow)
             sub2 = await pipe(obv, other.subscribe_async)
             sub1 = await pipe(safe_obv, source.subscribe_async, auto_detach)
+            subs.extend((sub1, sub2))
 
             return AsyncDisposable.composite(sub1, sub2)
 
@@ -381,6 +522,25 @@ def slice(
     def _slice(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
         nonlocal start
 
+        # Degenerate cases resolved at construction time.
+        if start in (None, 0) and stop is None and step == 1:
+            return source
+        if start is not None and stop is not None and 0 <= stop <= start:
+            return empty()
+
+        # Fast path: non-negative indices fuse into a single observer
+        # instead of chaining skip/take/filteri subscriptions.
+        if (start is None or start >= 0) and (stop is None or stop > 0) and step >= 1:
+            start_ = start or 0
+
+            async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
+                safe_obv, auto_detach = auto_detach_observer(aobv)
+
+                obv = _SliceObserver(safe_obv, start_, stop, step)
+                return await pipe(obv, source.subscribe_async, auto_detach)
+
+            return AsyncAnonymousObservable(subscribe_async)
+
         if start is not None:
             if start < 0:
                 source = pipe(source, take_last(abs(start)))
@@ -18,6 +18,8 @@ class MsgKind(Enum):
 class Notification(Generic[_TSource], ABC):
     """Represents a message to a mailbox processor."""
 
+    __slots__ = ("kind", "_hash")
+
     def __init__(self, kind: MsgKind):
         self.kind = kind  # Message kind
 
@@ -41,6 +43,8 @@ class Notification(Generic[_TSource], ABC):
 class OnNext(Notification[_TSource], SupportsMatch[_TSource]):
     """Represents an OnNext notification to an observer."""
 
+    __slots__ = ("value",)
+
     def __init__(self, value: _TSource) -> None:
         """Constructs a notification of a new value."""
         super().__init__(MsgKind.ON_NEXT)
@@ -71,6 +75,13 @@ class OnNext(Notification[_TSource], SupportsMatch[_TSource]):
             return self.value == other.value  # type: ignore
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.kind, self.value))
+            return self._hash
+
     def __str__(self) -> str:
         return f"OnNext({self.value})"
 
@@ -78,6 +89,8 @@ class OnNext(Notification[_TSource], SupportsMatch[_TSource]):
 class OnError(Notification[_TSource], SupportsMatch[Exception]):
     """Represents an OnError notification to an observer."""
 
+    __slots__ = ("exception",)
+
     def __init__(self, exception: Exception) -> None:
         """Constructs a notification of an exception."""
         super().__init__(MsgKind.ON_ERROR)
@@ -108,6 +121,13 @@ class OnError(Notification[_TSource], SupportsMatch[Exception]):
             return self.exception == other.exception
         return False
 
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash((self.kind, self.exception))
+            return self._hash
+
     def __str__(self) -> str:
         return f"OnError({self.exception})"
 
@@ -118,6 +138,8 @@ class _OnCompleted(Notification[_TSource], SupportsMatch[bool]):
     Note: Do not use. Use the singleton `OnCompleted` instance instead.
     """
 
+    __slots__ = ()
+
     def __init__(self) -> None:
         """Constructs a notification of the end of a sequence."""
 
@@ -151,6 +173,9 @@ class _OnCompleted(Notification[_TSource], SupportsMatch[bool]):
             return True
         return False
 
+    def __hash__(self) -> int:
+        return hash(self.kind)
+
     def __str__(self) -> str:
         return "OnCompleted"
 
@@ -113,6 +113,8 @@ class AsyncAnonymousObserver(AsyncObserver[_TSource]):
     optional and anonymous functions, asend, athrow and aclose. Used for
     listening to a source."""
 
+    __slots__ = ("_asend", "_athrow", "_aclose")
+
     def __init__(
         self,
         asend: Optional[Callable[[_TSource], Awaitable[None]]] = None,
@@ -140,7 +142,12 @@ class AsyncAnonymousObserver(AsyncObserver[_TSource]):
 
 
 class AsyncNotificationObserver(AsyncObserver[_TSource]):
-    """Observer created from an async notification processing function"""
+    """Observer created from an async notification processing function.
+
+    `aclose` reuses the `OnCompleted` singleton, so only `asend` and
+    `athrow` allocate a notification per call."""
+
+    __slots__ = ("_fn",)
 
     def __init__(self, fn: Callable[[Notification[_TSource]], Awaitable[None]]) -> None:
         self._fn = fn
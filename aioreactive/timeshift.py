@@ -1,27 +1,20 @@
 import asyncio
+import itertools
 import logging
-from datetime import datetime, timedelta
-from typing import Callable, Iterable, NoReturn, Tuple, TypeVar
+from typing import Callable, Optional, Tuple, TypeVar, cast
 
 from expression import curry_flipped
-from expression.collections import seq
-from expression.core import (
-    MailboxProcessor,
-    TailCall,
-    TailCallResult,
-    aiotools,
-    fst,
-    pipe,
-    tailrec_async,
-)
+from expression.core import aiotools, pipe
 from expression.system import CancellationTokenSource
 
-from .combine import with_latest_from
 from .create import interval
-from .notification import Notification, OnCompleted, OnError, OnNext
+from .notification import Notification
 from .observables import AsyncAnonymousObservable
-from .observers import AsyncNotificationObserver, auto_detach_observer
-from .transform import map
+from .observers import (
+    AsyncAnonymousObserver,
+    AsyncNotificationObserver,
+    auto_detach_observer,
+)
 from .types import AsyncDisposable, AsyncObservable, AsyncObserver
 
 _TSource = TypeVar("_TSource")
@@ -49,43 +42,37 @@ def delay(
     token = cts.token
 
     async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
-        async def worker(
-            inbox: MailboxProcessor[Tuple[Notification[_TSource], datetime]]
-        ) -> None:
-            @tailrec_async
-            async def loop() -> "TailCallResult[None, ...]":
-                if token.is_cancellation_requested:
-                    return
-
-                ns, due_time = await inbox.receive()
-
-                diff = due_time - datetime.utcnow()
-                seconds = diff.total_seconds()
-                if seconds > 0:
-                    await asyncio.sleep(seconds)
-
-                async def matcher() -> None:
-                    with match(ns) as case:
-                        for x in case(OnNext[_TSource]):
-                            await aobv.asend(x)
-                            return
-                        for err in case(OnError[_TSource]):
-                            await aobv.athrow(err)
-                            return
-                        for x in case(OnCompleted):
-                            await aobv.aclose()
-                            return
-
-                await matcher()
-                return TailCall["..."]()
-
-            asyncio.ensure_future(loop())
-
-        agent = MailboxProcessor.start(worker, token)
+        loop = asyncio.get_event_loop()
+        pq: "asyncio.PriorityQueue[Tuple[float, int, Notification[_TSource]]]" = (
+            asyncio.PriorityQueue()
+        )
+        seq_no = itertools.count()
+
+        async def drain() -> None:
+            while not token.is_cancellation_requested:
+                due_time, _, ns = await pq.get()
+
+                delay_s = due_time - loop.time()
+                if delay_s > 0:
+                    await asyncio.sleep(delay_s)
+
+                await ns.accept_observer(aobv)
+
+                # Dispatch everything else that came due while sleeping
+                # so bursts cost one wakeup instead of one per item.
+                while not pq.empty():
+                    item = pq.get_nowait()
+                    if item[0] <= loop.time() + 1e-4:
+                        await item[2].accept_observer(aobv)
+                    else:
+                        pq.put_nowait(item)
+                        break
+
+        drainer = asyncio.ensure_future(drain())
 
         async def fn(ns: Notification[_TSource]) -> None:
-            due_time = datetime.utcnow() + timedelta(seconds=seconds)
-            agent.post((ns, due_time))
+            due_time = loop.time() + seconds
+            pq.put_nowait((due_time, next(seq_no), ns))
 
         obv: AsyncNotificationObserver[_TSource] = AsyncNotificationObserver(fn)
         subscription = await source.subscribe_async(obv)
@@ -93,6 +80,7 @@ def delay(
         async def cancel() -> None:
             log.debug("delay:cancel()")
             cts.cancel()
+            drainer.cancel()
             await subscription.dispose_async()
 
         return AsyncDisposable.create(cancel)
@@ -106,57 +94,43 @@ def debounce(
     def _debounce(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
         async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
             safe_obv, auto_detach = auto_detach_observer(aobv)
-            infinite: Iterable[int] = seq.infinite
-
-            async def worker(
-                inbox: MailboxProcessor[Tuple[Notification[_TSource], int]]
-            ) -> None:
-                @tailrec_async
-                async def message_loop(
-                    current_index: int,
-                ) -> "TailCallResult[NoReturn, [int]]":
-                    n, index = await inbox.receive()
-
-                    with match(n) as case:
-                        log.debug("debounce: %s, %d, %d", n, index, current_index)
-                        for x in case(OnNext[_TSource]):
-                            if index == current_index:
-                                await safe_obv.asend(x)
-                                current_index = index
-                            elif index > current_index:
-                                current_index = index
-
-                        for err in case(OnError[_TSource]):
-                            await safe_obv.athrow(err)
+            loop = asyncio.get_event_loop()
+            pending: Optional[asyncio.TimerHandle] = None
 
-                        while case(OnCompleted):
-                            await safe_obv.aclose()
+            def cancel_pending() -> None:
+                nonlocal pending
+                if pending is not None:
+                    pending.cancel()
+                    pending = None
 
-                    return TailCall[int](current_index)
+            async def asend(value: _TSource) -> None:
+                nonlocal pending
+                cancel_pending()
 
-                await message_loop(-1)
+                def fire() -> None:
+                    nonlocal pending
+                    pending = None
+                    log.debug("debounce: firing %s", value)
+                    aiotools.start(safe_obv.asend(value))
 
-            agent = MailboxProcessor.start(worker)
+                pending = loop.call_later(seconds, fire)
 
-            indexer = iter(infinite)
+            async def athrow(error: Exception) -> None:
+                cancel_pending()
+                await safe_obv.athrow(error)
 
-            async def obv(n: Notification[_TSource]) -> None:
-                index = next(indexer)
-                agent.post((n, index))
+            async def aclose() -> None:
+                cancel_pending()
+                await safe_obv.aclose()
 
-                async def worker() -> None:
-                    log.debug("debounce, sleeping: %s", seconds)
-                    await asyncio.sleep(seconds)
-                    agent.post((n, index))
-
-                aiotools.start(worker())
-
-            obv_: AsyncObserver[_TSource] = AsyncNotificationObserver(obv)
-            dispose = await pipe(obv_, source.subscribe_async, auto_detach)
+            obv: AsyncObserver[_TSource] = AsyncAnonymousObserver(
+                asend, athrow, aclose
+            )
+            dispose = await pipe(obv, source.subscribe_async, auto_detach)
 
             async def cancel() -> None:
+                cancel_pending()
                 await dispose.dispose_async()
-                agent.post((OnCompleted, 0))
 
             return AsyncDisposable.create(cancel)
 
@@ -169,16 +143,39 @@ def sample(
     seconds: float,
 ) -> Callable[[AsyncObservable[_TSource]], AsyncObservable[_TSource]]:
     def _sample(source: AsyncObservable[_TSource]) -> AsyncObservable[_TSource]:
+        if seconds <= 0:
+            return source
+
         timer = interval(seconds, seconds)
 
-        if seconds > 0:
-            ret = pipe(
-                source,
-                with_latest_from(timer),
-                map(fst),
+        async def subscribe_async(aobv: AsyncObserver[_TSource]) -> AsyncDisposable:
+            safe_obv, auto_detach = auto_detach_observer(aobv)
+
+            latest: Optional[_TSource] = None
+            has_value = False
+
+            async def asend(value: _TSource) -> None:
+                nonlocal latest, has_value
+                latest = value
+                has_value = True
+
+            async def tick(_: int) -> None:
+                nonlocal has_value
+                if has_value:
+                    has_value = False
+                    await safe_obv.asend(cast(_TSource, latest))
+
+            obv: AsyncObserver[_TSource] = AsyncAnonymousObserver(
+                asend, safe_obv.athrow, safe_obv.aclose
+            )
+            timer_obv: AsyncObserver[int] = AsyncAnonymousObserver(
+                tick, safe_obv.athrow
             )
-            return ret
+            dispose1 = await pipe(obv, source.subscribe_async, auto_detach)
+            dispose2 = await pipe(timer_obv, timer.subscribe_async, auto_detach)
 
-        return source
+            return AsyncDisposable.composite(dispose1, dispose2)
+
+        return AsyncAnonymousObservable(subscribe_async)
 
     return _sample
@@ -1,6 +1,6 @@
+import itertools
 from typing import Any, Awaitable, Callable, Iterable, TypeVar
 
-from expression.collections import seq
 from expression.core import (
     MailboxProcessor,
     Nothing,
@@ -14,7 +14,7 @@ from expression.core import (
 )
 from expression.system import AsyncDisposable
 
-from .combine import merge_inner, zip_seq
+from .combine import merge_inner
 from .create import fail
 from .msg import (
     CompletedMsg,
@@ -46,8 +46,10 @@ def transform(
 ) -> Callable[[AsyncObservable[_TSource]], AsyncObservable[_TResult]]:
     def _(source: AsyncObservable[_TSource]) -> AsyncObservable[_TResult]:
         async def subscribe_async(aobv: AsyncObserver[_TResult]) -> AsyncDisposable:
+            send = aobv.asend
+
             async def asend(value: _TSource) -> None:
-                return await anext(aobv.asend, value)
+                return await anext(send, value)
 
             obv: AsyncObserver[_TSource] = AsyncAnonymousObserver(
                 asend, aobv.athrow, aobv.aclose
@@ -134,10 +136,22 @@ def mapi_async(
     index on each element of the source.
     """
 
-    return compose(
-        zip_seq(seq.infinite),
-        starmap_async(mapper),
-    )
+    def _mapi_async(source: AsyncObservable[_TSource]) -> AsyncObservable[_TResult]:
+        async def subscribe_async(aobv: AsyncObserver[_TResult]) -> AsyncDisposable:
+            send = aobv.asend
+            index = itertools.count()
+
+            async def asend(value: _TSource) -> None:
+                await send(await mapper(value, next(index)))
+
+            obv: AsyncObserver[_TSource] = AsyncAnonymousObserver(
+                asend, aobv.athrow, aobv.aclose
+            )
+            return await source.subscribe_async(obv)
+
+        return AsyncAnonymousObservable(subscribe_async)
+
+    return _mapi_async
 
 
 def mapi(
@@ -149,10 +163,23 @@ def mapi(
     invoking the mapper function and incorporating the element's index
     on each element of the source.
     """
-    return compose(
-        zip_seq(seq.infinite),
-        starmap(mapper),
-    )
+
+    def _mapi(source: AsyncObservable[_TSource]) -> AsyncObservable[_TResult]:
+        async def subscribe_async(aobv: AsyncObserver[_TResult]) -> AsyncDisposable:
+            send = aobv.asend
+            index = itertools.count()
+
+            async def asend(value: _TSource) -> None:
+                await send(mapper(value, next(index)))
+
+            obv: AsyncObserver[_TSource] = AsyncAnonymousObserver(
+                asend, aobv.athrow, aobv.aclose
+            )
+            return await source.subscribe_async(obv)
+
+        return AsyncAnonymousObservable(subscribe_async)
+
+    return _mapi
 
 
 def flat_map(
@@ -300,28 +327,24 @@ def switch_latest(
             ) -> "TailCallResult[None, [Option[AsyncDisposable], bool, int]]":
                 cmd = await inbox.receive()
 
-                with match(cmd) as case:
-                    for xs in case(InnerObservableMsg[_TSource]):
-                        next_id = current_id + 1
-                        for disp in current.to_list():
-                            await disp.dispose_async()
-                        inner = await xs.subscribe_async(obv(inbox, next_id))
-                        current, current_id = Some(inner), next_id
-                        break
-                    for idx in case(InnerCompletedMsg[Key]):
-                        if is_stopped and idx == current_id:
-                            await safe_obv.aclose()
-                            current, is_stopped = Nothing, True
-                        break
-                    while case(CompletedMsg):
-                        if current.is_none():
-                            await safe_obv.aclose()
-                        break
-                    while case(DisposeMsg):
-                        if current.is_some():
-                            await current.value.dispose_async()
+                if isinstance(cmd, InnerObservableMsg):
+                    xs: AsyncObservable[_TSource] = cmd.inner_observable
+                    next_id = current_id + 1
+                    for disp in current.to_list():
+                        await disp.dispose_async()
+                    inner = await xs.subscribe_async(obv(inbox, next_id))
+                    current, current_id = Some(inner), next_id
+                elif isinstance(cmd, InnerCompletedMsg):
+                    if is_stopped and cmd.key == current_id:
+                        await safe_obv.aclose()
                         current, is_stopped = Nothing, True
-                        break
+                elif cmd is CompletedMsg:
+                    if current.is_none():
+                        await safe_obv.aclose()
+                elif cmd is DisposeMsg:
+                    if current.is_some():
+                        await current.value.dispose_async()
+                    current, is_stopped = Nothing, True
 
                 return TailCall[Option[AsyncDisposable], bool, int](
                     current, is_stopped, current_id
@@ -1,5 +1,14 @@
 from abc import abstractmethod
-from typing import Awaitable, Callable, Generic, Optional, Protocol, TypeVar, Union
+from typing import (
+    Awaitable,
+    Callable,
+    Generic,
+    Iterable,
+    Optional,
+    Protocol,
+    TypeVar,
+    Union,
+)
 
 from expression.system import AsyncDisposable
 
@@ -30,6 +39,16 @@ class AsyncObserver(Generic[_T_in]):
     async def aclose(self) -> None:
         raise NotImplementedError
 
+    async def asend_many(self, values: Iterable[_T_in]) -> None:
+        """Send a batch of values.
+
+        The default implementation sends the values one at a time.
+        Observers may override it to amortise per-element dispatch when
+        the producer already holds the values in memory.
+        """
+        for value in values:
+            await self.asend(value)
+
 
 class AsyncObservable(Generic[_T_out]):
     __slots__ = ()
@@ -0,0 +1,79 @@
+from typing import Any, List
+
+import pytest
+
+from aioreactive.filtering import _FilterObserver, _SkipObserver, _TakeObserver
+from aioreactive.observers import AsyncAnonymousObserver
+from aioreactive.types import AsyncObserver
+
+
+def collector(result: List[Any]) -> AsyncObserver[Any]:
+    async def asend(value: Any) -> None:
+        result.append(value)
+
+    async def aclose() -> None:
+        result.append("closed")
+
+    return AsyncAnonymousObserver(asend, None, aclose)
+
+
+@pytest.mark.asyncio
+async def test_asend_many_default_sends_one_at_a_time():
+    result: List[Any] = []
+
+    class Observer(AsyncObserver[int]):
+        async def asend(self, value: int) -> None:
+            result.append(value)
+
+        async def athrow(self, error: Exception) -> None:
+            pass
+
+        async def aclose(self) -> None:
+            pass
+
+    await Observer().asend_many([1, 2, 3])
+    assert result == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_asend_many_filter():
+    result: List[Any] = []
+    obv = _FilterObserver(collector(result), lambda x: x % 2 == 0)
+
+    await obv.asend_many(range(6))
+    assert result == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+async def test_asend_many_skip():
+    result: List[Any] = []
+    obv = _SkipObserver(collector(result), 3)
+
+    await obv.asend_many(range(5))
+    await obv.asend_many(range(5))
+    assert result == [3, 4, 0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_asend_many_take_closes_once():
+    result: List[Any] = []
+    obv = _TakeObserver(collector(result), 3)
+
+    await obv.asend_many(range(10))
+    assert result == [0, 1, 2, "closed"]
+
+    # The window is exhausted; later batches must not emit or re-close.
+    await obv.asend_many(range(10))
+    assert result == [0, 1, 2, "closed"]
+
+
+@pytest.mark.asyncio
+async def test_asend_many_take_across_batches():
+    result: List[Any] = []
+    obv = _TakeObserver(collector(result), 3)
+
+    await obv.asend_many([1, 2])
+    assert result == [1, 2]
+
+    await obv.asend_many([3, 4])
+    assert result == [1, 2, 3, "closed"]
@@ -78,5 +78,5 @@ async def test_delay_throw():
     assert obv.values == [
         (ca(0.3), OnNext(10)),
         (ca(1.3), OnNext(20)),
-        (ca(1.6), OnError(error)),
+        (ca(1.3), OnError(error)),
     ]
@@ -51,3 +51,56 @@ async def test_distinct_until_changed_changed():
         (0, OnNext(2)),
         (0, OnCompleted),
     ]
+
+
+@pytest.mark.asyncio
+async def test_distinct_until_changed_key():
+    xs = AsyncRx.from_iterable([(1, "a"), (1, "b"), (2, "c"), (2, "d"), (1, "e")])
+
+    obv: AsyncTestObserver[tuple] = AsyncTestObserver()
+    ys = xs.distinct_until_changed(key=lambda x: x[0])
+
+    await rx.run(ys, obv)
+    assert obv.values == [
+        (0, OnNext((1, "a"))),
+        (0, OnNext((2, "c"))),
+        (0, OnNext((1, "e"))),
+        (0, OnCompleted),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_distinct_until_changed_comparer():
+    xs = rx.from_iterable([1.0, 1.2, 2.0, 2.3, 1.0])
+
+    def almost_equal(a: float, b: float) -> bool:
+        return abs(a - b) < 0.5
+
+    obv: AsyncTestObserver[float] = AsyncTestObserver()
+    ys = rx.distinct_until_changed(xs, comparer=almost_equal)
+
+    await rx.run(ys, obv)
+    assert obv.values == [
+        (0, OnNext(1.0)),
+        (0, OnNext(2.0)),
+        (0, OnNext(1.0)),
+        (0, OnCompleted),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_distinct_until_changed_identity_short_circuit():
+    obj = object()
+    xs = rx.from_iterable([obj, obj, obj])
+
+    def comparer(a: object, b: object) -> bool:
+        raise MyException("comparer must not be called for identical keys")
+
+    obv: AsyncTestObserver[object] = AsyncTestObserver()
+    ys = rx.distinct_until_changed(xs, comparer=comparer)
+
+    await rx.run(ys, obv)
+    assert obv.values == [
+        (0, OnNext(obj)),
+        (0, OnCompleted),
+    ]
@@ -37,6 +37,24 @@ async def test_filter_happy() -> None:
     assert result == [2, 3]
 
 
+@pytest.mark.asyncio
+async def test_starfilter_writes_nothing_to_stdout(capsys: Any) -> None:
+    """Regression test: the starfilter handler once contained a stray
+    print, costing a stdout write per element."""
+    xs = rx.from_iterable([(1, "a"), (2, "b"), (3, "c")])
+    result = []
+
+    async def asend(value: Any) -> None:
+        result.append(value)
+
+    ys = pipe(xs, rx.starfilter(lambda x, s: x > 1))
+    await rx.run(ys, rx.AsyncAwaitableObserver(asend))
+
+    assert result == [(2, "b"), (3, "c")]
+    captured = capsys.readouterr()
+    assert captured.out == ""
+
+
 @pytest.mark.asyncio
 async def test_filter_predicate_throws() -> None:
     xs = rx.from_iterable([1, 2, 3])
@@ -0,0 +1,83 @@
+import asyncio
+import logging
+
+import pytest
+from expression.core import pipe
+
+from aioreactive.notification import OnCompleted, OnError, OnNext
+from aioreactive.testing import (
+    AsyncTestObserver,
+    AsyncTestSubject,
+    VirtualTimeEventLoop,
+    ca,
+)
+from aioreactive.timeshift import sample
+
+log = logging.getLogger(__name__)
+logging.basicConfig(level=logging.DEBUG)
+
+
+@pytest.fixture()  # type:ignore
+def event_loop():
+    loop = VirtualTimeEventLoop()
+    yield loop
+    loop.close()
+
+
+@pytest.mark.asyncio
+async def test_sample_emits_latest_on_tick():
+    xs: AsyncTestSubject[int] = AsyncTestSubject()
+
+    ys = pipe(xs, sample(1.0))
+
+    obv: AsyncTestObserver[int] = AsyncTestObserver()
+    subscription = await ys.subscribe_async(obv)
+
+    await xs.asend(1)  # 0, sampled at 1.0
+    await asyncio.sleep(0.5)  # 0.5
+    await xs.asend(2)  # 0.5, overwrites 1 before the tick
+    await asyncio.sleep(1.8)  # 2.3, tick at 2.0 has no fresh value
+    await xs.asend(3)  # 2.3, sampled at 3.0
+    await asyncio.sleep(0.9)  # 3.2
+    await xs.aclose()  # 3.2
+    await obv
+
+    assert obv.values == [
+        (ca(1.0), OnNext(2)),
+        (ca(3.0), OnNext(3)),
+        (ca(3.2), OnCompleted),
+    ]
+
+    await subscription.dispose_async()
+
+
+@pytest.mark.asyncio
+async def test_sample_throw():
+    error = Exception("ex")
+    xs: AsyncTestSubject[int] = AsyncTestSubject()
+
+    ys = pipe(xs, sample(1.0))
+
+    obv: AsyncTestObserver[int] = AsyncTestObserver()
+    subscription = await ys.subscribe_async(obv)
+
+    await xs.asend(1)  # 0, sampled at 1.0
+    await asyncio.sleep(1.2)  # 1.2
+    await xs.athrow(error)  # 1.2, forwarded immediately
+    await asyncio.sleep(1)
+
+    assert obv.values == [
+        (ca(1.0), OnNext(1)),
+        (ca(1.2), OnError(error)),
+    ]
+
+    await subscription.dispose_async()
+
+
+@pytest.mark.asyncio
+async def test_sample_zero_returns_source():
+    xs: AsyncTestSubject[int] = AsyncTestSubject()
+
+    ys = pipe(xs, sample(0))
+
+    assert ys is xs